@@ -13,13 +13,16 @@ Usage:
     - Use fixed_size_subplots to create subplot grids with fixed dimensions.
 """
 
-import colorsys
+from collections.abc import Callable, Iterable, Mapping
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, NamedTuple
 
 import matplotlib as mpl
 import numpy as np
+from cycler import Cycler, cycler
 from matplotlib import RcParams
 from matplotlib import pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
@@ -31,6 +34,44 @@ from matplotlib.colors import LinearSegmentedColormap
 """
 
 
+# font lists shared by the style presets; tuples so no preset can mutate another's
+_ARIAL_ONLY: tuple[str, ...] = ("Arial",)
+
+_FALLBACK_SANS: tuple[str, ...] = (
+    "Arial",
+    "DejaVu Sans",
+    "Helvetica",
+    "Lucida Grande",
+    "Verdana",
+    "Geneva",
+    "Lucid",
+    "Avant Garde",
+    "sans-serif",
+)
+
+_DEJAVU_FALLBACK_SANS: tuple[str, ...] = (
+    "DejaVu Sans",
+    "Arial",
+    "Helvetica",
+    "Lucida Grande",
+    "Verdana",
+    "Geneva",
+    "Lucid",
+    "Avant Garde",
+    "sans-serif",
+)
+
+
+_EXPORT_TEXT_TYPE: MappingProxyType = MappingProxyType({
+    "pdf.fonttype": 42,
+    "ps.fonttype": 42,
+    "font.family": "sans-serif",
+    "font.sans-serif": _ARIAL_ONLY,
+})
+
+_PUB_SUFFIXES: frozenset[str] = frozenset({".pdf", ".png", ".jpg", ".jpeg", ".svg"})
+
+
 def set_export_text_type() -> None:
     """
     Set the font type for PDF and PS exports to ensure text is editable in Illustrator.
@@ -38,10 +79,7 @@ def set_export_text_type() -> None:
     :returns: None
     :rtype: None
     """
-    mpl.rcParams["pdf.fonttype"] = 42
-    mpl.rcParams["ps.fonttype"] = 42
-    mpl.rcParams["font.family"] = "sans-serif"
-    mpl.rcParams["font.sans-serif"] = ["Arial"]
+    mpl.rcParams.update(_EXPORT_TEXT_TYPE)
 
 def export_for_review(fig: plt.Figure, path: Path, **kwargs: Any) -> None:
     """
@@ -59,23 +97,31 @@ def export_for_review(fig: plt.Figure, path: Path, **kwargs: Any) -> None:
     if path.suffix != ".png":
         path = path.with_suffix(".png")
     fig.savefig(path, **kwargs)
-    
-def export_for_pub(fig: plt.Figure, path: Path, **kwargs: Any) -> None:
+
+
+def export_for_pub(
+    fig: plt.Figure, path: Path, dpi: float | None = None, **kwargs: Any
+) -> None:
     """
     Export a figure for publication.
 
+    Paths with a PDF, PNG, JPEG, or SVG suffix keep their format; anything else is
+    exported as a PDF.
+
     :param fig: The figure to export.
     :type fig: plt.Figure
     :param path: The path to save the figure to.
     :type path: Path
+    :param dpi: Resolution for raster formats; None uses ``savefig.dpi``.
+    :type dpi: float | None
     :param kwargs: Additional keyword arguments for ``fig.savefig``.
     :type kwargs: Any
     :returns: None
     :rtype: None
     """
-    if path.suffix != ".pdf":
+    if path.suffix.lower() not in _PUB_SUFFIXES:
         path = path.with_suffix(".pdf")
-    fig.savefig(path, transparent=True, **kwargs)
+    fig.savefig(path, dpi=dpi, transparent=True, **kwargs)
 
 
 def desaturate(color: "Color", factor: float) -> "Color":
@@ -89,9 +135,78 @@ def desaturate(color: "Color", factor: float) -> "Color":
     :returns: The desaturated color.
     :rtype: Color
     """
-    h, l, s = colorsys.rgb_to_hls(color.r, color.g, color.b)  # noqa: E741
-    s *= factor
-    return Color(*colorsys.hls_to_rgb(h, l, s))
+    r, g, b, a = color
+    l = 0.5 * (max(r, g, b) + min(r, g, b))  # noqa: E741
+    return Color(l + (r - l) * factor, l + (g - l) * factor, l + (b - l) * factor, a)
+
+
+def desaturate_array(colors: np.ndarray, factor: float) -> np.ndarray:
+    """
+    Desaturate an array of colors (e.g., a palette or an image) by a factor.
+
+    Scaling the HLS saturation at constant hue and lightness is equivalent to
+    scaling each channel's distance from the lightness, so no explicit HLS
+    round-trip is needed. Any alpha channel is passed through unchanged. Images
+    (3-D arrays) use a compiled kernel when numba is installed.
+
+    :param colors: RGB or RGBA colors (0-1) with channels on the last axis.
+    :type colors: np.ndarray
+    :param factor: The factor to desaturate by.
+    :type factor: float
+    :returns: The desaturated colors with the same shape as the input.
+    :rtype: np.ndarray
+    :raises ValueError: If the last axis has fewer than three channels.
+    """
+    colors = np.asarray(colors, dtype=float)
+    if colors.ndim == 0 or colors.shape[-1] < 3:
+        msg = f"Expected RGB(A) colors on the last axis, got shape {colors.shape}"
+        raise ValueError(msg)
+    desaturated = colors.copy()
+    # images take the compiled path when numba is available
+    if colors.ndim == 3:
+        kernel = _desaturate_image_kernel()
+        if kernel is not None:
+            kernel(colors, factor, desaturated)
+            return desaturated
+    rgb = colors[..., :3]
+    lightness = 0.5 * (
+        rgb.max(axis=-1, keepdims=True) + rgb.min(axis=-1, keepdims=True)
+    )
+    desaturated[..., :3] = lightness + (rgb - lightness) * factor
+    return desaturated
+
+
+@lru_cache(maxsize=1)
+def _desaturate_image_kernel() -> Callable | None:
+    """
+    Compile the image desaturation kernel on first use.
+
+    numba is imported here rather than at module level, so importing this module
+    does not pay for numba unless an image is actually desaturated.
+
+    :returns: The compiled kernel, or None if numba is not installed.
+    :rtype: Callable | None
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, fastmath=True)
+    def _desaturate_image(image: np.ndarray, factor: float, out: np.ndarray) -> None:
+        # desaturate the RGB channels of an (M, N, C >= 3) image into out;
+        # channels beyond RGB in out are left untouched
+        for i in prange(image.shape[0]):
+            for j in range(image.shape[1]):
+                r = image[i, j, 0]
+                g = image[i, j, 1]
+                b = image[i, j, 2]
+                l = 0.5 * (max(r, g, b) + min(r, g, b))  # noqa: E741
+                out[i, j, 0] = l + (r - l) * factor
+                out[i, j, 1] = l + (g - l) * factor
+                out[i, j, 2] = l + (b - l) * factor
+
+    return _desaturate_image
 
 
 def millimeter_to_inches(mm: float) -> float:
@@ -137,6 +252,40 @@ class Color(NamedTuple):
     b: float
     a: float = 1.0
 
+    @staticmethod
+    def stack(colors: "Iterable[Color]") -> np.ndarray:
+        """
+        Stack colors into an (N, 4) RGBA array.
+
+        Passing the stacked array to matplotlib once is cheaper than handing it
+        each color separately.
+
+        :param colors: The colors to stack.
+        :type colors: Iterable[Color]
+        :returns: An (N, 4) array of RGBA values.
+        :rtype: np.ndarray
+        :raises ValueError: If the colors are not RGBA.
+        """
+        colors = list(colors)
+        if not colors:
+            return np.empty((0, 4))
+        arr = np.asarray(colors, dtype=float)
+        if arr.ndim != 2 or arr.shape[1] != 4:
+            msg = f"Expected RGBA colors, got an array of shape {arr.shape}"
+            raise ValueError(msg)
+        return arr
+
+    def with_alpha(self, a: float) -> "Color":
+        """
+        Return a copy of this color with a different alpha.
+
+        :param a: Alpha channel (0-1).
+        :type a: float
+        :returns: The color with the new alpha.
+        :rtype: Color
+        """
+        return self._replace(a=a)
+
 
 class ColorRegistry(Enum):
     """
@@ -173,7 +322,8 @@ class ColorRegistry(Enum):
     DARK_BLUE = Color(0 / 255, 104 / 255, 138 / 255)
 
     def __call__(self, *args, **kwargs) -> Color:  # noqa: ARG002
-        return self.value
+        # read the stored member value directly, skipping the ``value`` descriptor
+        return self._value_
 
 
 class ColorScheme:
@@ -186,7 +336,7 @@ class ColorScheme:
     # ANNOTATIONS & ADD-ONS
     SCATTER_BORDER: Color = ColorRegistry.CHARCOAL.value
     SECONDARY_LINE: Color = ColorRegistry.CHARCOAL.value
-    RECTANGLE_SHADE: Color = Color(*ColorRegistry.LIGHTEST_GRAY.value[:-1], 0.75)
+    RECTANGLE_SHADE: Color = ColorRegistry.LIGHTEST_GRAY.value.with_alpha(0.75)
     SIGNIFICANCE: Color = ColorRegistry.CHARCOAL.value
     INVISIBLE: Color = ColorRegistry.INVISIBLE.value
     # DEFAULTS
@@ -197,6 +347,9 @@ class ColorScheme:
         ColorRegistry.DESATURATED_ORANGE.value,
         ColorRegistry.DESATURATED_PURPLE.value,
     )
+    _NDEFAULTS: int = len(DEFAULTS)
+    _DEFAULTS_ARR: np.ndarray = Color.stack(DEFAULTS)
+    _DEFAULT_CYCLE: Cycler = cycler(color=_DEFAULTS_ARR.tolist())
 
     @classmethod
     def get_defaults(cls, idx: int) -> Color:
@@ -208,7 +361,20 @@ class ColorScheme:
         :returns: Color from the defaults.
         :rtype: Color
         """
-        return cls.DEFAULTS[idx % len(cls.DEFAULTS)]
+        return cls.DEFAULTS[idx % cls._NDEFAULTS]
+
+    @classmethod
+    def get_default_cycle(cls) -> Cycler:
+        """
+        Get a color cycle of the defaults, e.g., for ``axes.prop_cycle``.
+
+        The colors are converted once; each call returns a copy of the cycle, so it
+        can be extended in place without affecting later callers.
+
+        :returns: Color cycle of the defaults.
+        :rtype: Cycler
+        """
+        return cycler(cls._DEFAULT_CYCLE)
 
     def __new__(cls):
         """
@@ -258,7 +424,7 @@ desaturated_colormap_r = LinearSegmentedColormap.from_list(
 """
 
 
-PY_GRID: dict = {
+PY_GRID: MappingProxyType = MappingProxyType({
     "figure.facecolor": "white",
     "axes.grid": True,
     "grid.linestyle": "-",
@@ -278,10 +444,10 @@ PY_GRID: dict = {
     "axes.spines.right": True,
     "axes.xmargin": 0,
     "axes.ymargin": 0.05,
-}
+})
 
 
-FOV_GRID: dict = {
+FOV_GRID: MappingProxyType = MappingProxyType({
     "figure.facecolor": "white",
     "axes.grid": True,
     "grid.linestyle": "--",
@@ -301,10 +467,10 @@ FOV_GRID: dict = {
     "xtick.minor.size": 0,
     "ytick.major.size": 0,
     "ytick.minor.size": 0,
-}
+})
 
 
-XYZ_FOV: dict = {
+XYZ_FOV: MappingProxyType = MappingProxyType({
     "figure.facecolor": "white",
     "axes.grid": False,
     "axes.linewidth": 2,
@@ -321,10 +487,10 @@ XYZ_FOV: dict = {
     "xtick.minor.size": 0,
     "ytick.major.size": 0,
     "ytick.minor.size": 0,
-}
+})
 
 
-D3_GRID: dict = {
+D3_GRID: MappingProxyType = MappingProxyType({
     "figure.facecolor": "white",
     "axes.grid": True,
     "grid.linestyle": "--",
@@ -344,10 +510,10 @@ D3_GRID: dict = {
     "xtick.minor.size": 0,
     "ytick.major.size": 0,
     "ytick.minor.size": 0,
-}
+})
 
 
-BLANK: dict = {
+BLANK: MappingProxyType = MappingProxyType({
     "figure.facecolor": "white",
     "axes.grid": False,
     "axes.linewidth": 0,
@@ -364,20 +530,18 @@ BLANK: dict = {
     "xtick.minor.size": 0,
     "ytick.major.size": 0,
     "ytick.minor.size": 0,
-}
+})
 
 
-SINGLE_PANEL_PUB: dict = {
-    "figure.figsize": (millimeter_to_inches(55), millimeter_to_inches(51)),
+SINGLE_PANEL_PUB: MappingProxyType = MappingProxyType({
+    "figure.figsize": (55 / 25.4, 51 / 25.4),  # 55 x 51 mm
     "axes.labelsize": 7,
     "xtick.labelsize": 6,
     "ytick.labelsize": 6,
     "legend.fontsize": 7,
     "font.size": 7,
     "font.family": "sans-serif",
-    "font.sans-serif": [
-        "Arial",
-    ],
+    "font.sans-serif": _ARIAL_ONLY,
     "mathtext.fontset": "dejavusans",
     "axes.linewidth": 0.5,
     "grid.linewidth": 0.5,
@@ -387,20 +551,18 @@ SINGLE_PANEL_PUB: dict = {
     # "savefig.pad_inches": 0.01,
     "xtick.direction": "out",
     "ytick.direction": "out",
-}
+})
 
 
-TWO_PANEL_PUB_WIDE: dict = {
-    "figure.figsize": (millimeter_to_inches(120), millimeter_to_inches(51)),
+TWO_PANEL_PUB_WIDE: MappingProxyType = MappingProxyType({
+    "figure.figsize": (120 / 25.4, 51 / 25.4),  # 120 x 51 mm
     "axes.labelsize": 7,
     "xtick.labelsize": 6,
     "ytick.labelsize": 6,
     "legend.fontsize": 7,
     "font.size": 7,
     "font.family": "sans-serif",
-    "font.sans-serif": [
-        "Arial",
-    ],
+    "font.sans-serif": _ARIAL_ONLY,
     "mathtext.fontset": "dejavusans",
     "axes.linewidth": 0.5,
     "grid.linewidth": 0.5,
@@ -410,10 +572,10 @@ TWO_PANEL_PUB_WIDE: dict = {
     ##"savefig.pad_inches": 0.01,
     "xtick.direction": "out",
     "ytick.direction": "out",
-}
+})
 
 
-_PUB: dict = {
+_PUB: MappingProxyType = MappingProxyType({
     "figure.figsize": (3.3, 2.5),
     "axes.labelsize": 8,
     "xtick.labelsize": 6,
@@ -421,18 +583,7 @@ _PUB: dict = {
     "legend.fontsize": 8,
     "font.size": 7,
     "font.family": "sans-serif",
-    "font.sans-serif": [
-        "Arial",
-        "DejaVu Sans",
-        # "Arial",
-        "Helvetica",
-        "Lucida Grande",
-        "Verdana",
-        "Geneva",
-        "Lucid",
-        "Avant Garde",
-        "sans-serif",
-    ],
+    "font.sans-serif": _FALLBACK_SANS,
     "mathtext.fontset": "dejavusans",
     "axes.linewidth": 0.5,
     "grid.linewidth": 0.5,
@@ -457,27 +608,18 @@ _PUB: dict = {
     "axes.spines.top": False,
     "axes.spines.right": False,
     "legend.frameon": False,
-}
+})
 
 
-PUB2: dict = {
+# shared by the PUB* presets below, which override only what differs
+_PUB_BASE: MappingProxyType = MappingProxyType({
     "axes.labelsize": 7,
     "xtick.labelsize": 6,
     "ytick.labelsize": 6,
     "legend.fontsize": 7,
     "font.size": 7,
     "font.family": "sans-serif",
-    "font.sans-serif": [
-        "DejaVu Sans",
-        "Arial",
-        "Helvetica",
-        "Lucida Grande",
-        "Verdana",
-        "Geneva",
-        "Lucid",
-        "Avant Garde",
-        "sans-serif",
-    ],
+    "font.sans-serif": _ARIAL_ONLY,
     "mathtext.fontset": "dejavusans",
     "axes.linewidth": 0.5,
     "grid.linewidth": 0.5,
@@ -486,299 +628,131 @@ PUB2: dict = {
     # "savefig.bbox": "tight",
     # "savefig.pad_inches": 0.01,
     "xtick.direction": "out",
+    "xtick.top": False,
+    "ytick.direction": "out",
+    "ytick.right": False,
+    "legend.frameon": False,
+    "axes.spines.top": False,
+    "axes.spines.right": False,
+})
+
+
+_PUB_XTICKS: MappingProxyType = MappingProxyType({
     "xtick.major.size": 3,
     "xtick.major.width": 0.5,
     "xtick.minor.size": 1.5,
     "xtick.minor.width": 0.5,
     "xtick.minor.visible": True,
-    "xtick.top": False,
-    "ytick.direction": "out",
+})
+
+
+_PUB_YTICKS: MappingProxyType = MappingProxyType({
     "ytick.major.size": 3,
     "ytick.major.width": 0.5,
     "ytick.minor.size": 1.5,
     "ytick.minor.width": 0.5,
     "ytick.minor.visible": True,
-    "ytick.right": False,
-    "legend.frameon": False,
-    "axes.spines.top": False,
-    "axes.spines.right": False,
-}
+})
 
 
-PUB_IMAGE: dict = {
-    "axes.labelsize": 7,
-    "xtick.labelsize": 0,
-    "ytick.labelsize": 0,
-    "legend.fontsize": 7,
-    "font.size": 7,
-    "font.family": "sans-serif",
-    "font.sans-serif": [
-        "Arial",
-    ],
-    "mathtext.fontset": "dejavusans",
-    "axes.linewidth": 0.5,
-    "grid.linewidth": 0.5,
-    "lines.linewidth": 1.0,
-    "lines.markersize": 3,
-    # "savefig.bbox": "tight",
-    # "savefig.pad_inches": 0.01,
-    "xtick.direction": "out",
+_PUB_NO_XTICKS: MappingProxyType = MappingProxyType({
     "xtick.major.size": 0,
     "xtick.major.width": 0,
     "xtick.minor.size": 0,
     "xtick.minor.width": 0,
     "xtick.minor.visible": False,
-    "xtick.top": False,
-    "ytick.direction": "out",
+})
+
+
+_PUB_NO_YTICKS: MappingProxyType = MappingProxyType({
     "ytick.major.size": 0,
     "ytick.major.width": 0,
     "ytick.minor.size": 0,
     "ytick.minor.width": 0,
     "ytick.minor.visible": False,
-    "ytick.right": False,
-    "legend.frameon": False,
-    "axes.spines.top": False,
-    "axes.spines.right": False,
+})
+
+
+PUB2: MappingProxyType = MappingProxyType({
+    **_PUB_BASE,
+    **_PUB_XTICKS,
+    **_PUB_YTICKS,
+    "font.sans-serif": _DEJAVU_FALLBACK_SANS,
+})
+
+
+PUB_IMAGE: MappingProxyType = MappingProxyType({
+    **_PUB_BASE,
+    **_PUB_NO_XTICKS,
+    **_PUB_NO_YTICKS,
+    "xtick.labelsize": 0,
+    "ytick.labelsize": 0,
     "axes.spines.left": False,
     "axes.spines.bottom": False,
-}
+})
 
 
-PUB_IMAGE_BOUNDS: dict = {
-    "axes.labelsize": 7,
-    "xtick.labelsize": 6,
-    "ytick.labelsize": 6,
-    "legend.fontsize": 7,
-    "font.size": 7,
-    "font.family": "sans-serif",
-    "font.sans-serif": [
-        "DejaVu Sans",
-        "Arial",
-        "Helvetica",
-        "Lucida Grande",
-        "Verdana",
-        "Geneva",
-        "Lucid",
-        "Avant Garde",
-        "sans-serif",
-    ],
-    "mathtext.fontset": "dejavusans",
-    "axes.linewidth": 0.5,
-    "grid.linewidth": 0.5,
-    "lines.linewidth": 1.0,
-    "lines.markersize": 3,
-    # "savefig.bbox": "tight",
-    # "savefig.pad_inches": 0.01,
-    "xtick.direction": "out",
-    "xtick.major.size": 0,
-    "xtick.major.width": 0,
-    "xtick.minor.size": 0,
-    "xtick.minor.width": 0,
-    "xtick.minor.visible": False,
-    "xtick.top": False,
-    "ytick.direction": "out",
-    "ytick.major.size": 0,
-    "ytick.major.width": 0,
-    "ytick.minor.size": 0,
-    "ytick.minor.width": 0,
-    "ytick.minor.visible": False,
-    "ytick.right": False,
-    "legend.frameon": False,
+PUB_IMAGE_BOUNDS: MappingProxyType = MappingProxyType({
+    **_PUB_BASE,
+    **_PUB_NO_XTICKS,
+    **_PUB_NO_YTICKS,
+    "font.sans-serif": _DEJAVU_FALLBACK_SANS,
     "axes.spines.top": True,
     "axes.spines.right": True,
     "axes.spines.left": True,
     "axes.spines.bottom": True,
-}
+})
 
 
-PUB_EMPTY: dict = {
-    "axes.labelsize": 7,
+PUB_EMPTY: MappingProxyType = MappingProxyType({
+    **_PUB_BASE,
+    **_PUB_NO_XTICKS,
+    **_PUB_NO_YTICKS,
     "xtick.labelsize": 0,
     "ytick.labelsize": 0,
-    "legend.fontsize": 7,
-    "font.size": 7,
-    "font.family": "sans-serif",
-    "font.sans-serif": [
-        "Arial",
-    ],
-    "mathtext.fontset": "dejavusans",
-    "axes.linewidth": 0.5,
-    "grid.linewidth": 0.5,
-    "lines.linewidth": 1.0,
-    "lines.markersize": 3,
-    # "savefig.bbox": "tight",
-    # "savefig.pad_inches": 0.01,
-    "xtick.direction": "out",
-    "xtick.major.size": 0,
-    "xtick.major.width": 0,
-    "xtick.minor.size": 0,
-    "xtick.minor.width": 0,
-    "xtick.minor.visible": False,
-    "xtick.top": False,
-    "ytick.direction": "out",
-    "ytick.major.size": 0,
-    "ytick.major.width": 0,
-    "ytick.minor.size": 0,
-    "ytick.minor.width": 0,
-    "ytick.minor.visible": False,
-    "ytick.right": False,
-    "legend.frameon": False,
     "axes.spines.left": False,
     "axes.spines.bottom": False,
-    "axes.spines.top": False,
-    "axes.spines.right": False,
-}
+})
 
 
-PUB_VIOLIN: dict = {
-    "axes.labelsize": 7,
-    "xtick.labelsize": 6,
-    "ytick.labelsize": 6,
-    "legend.fontsize": 7,
-    "font.size": 7,
-    "font.family": "sans-serif",
-    "font.sans-serif": [
-        "Arial",
-    ],
-    "mathtext.fontset": "dejavusans",
-    "axes.linewidth": 0.5,
-    "grid.linewidth": 0.5,
-    "lines.linewidth": 1.0,
-    "lines.markersize": 3,
-    # "savefig.bbox": "tight",
-    # "savefig.pad_inches": 0.01,
-    "xtick.direction": "out",
-    "xtick.major.size": 0,
-    "xtick.major.width": 0,
-    "xtick.minor.size": 0,
-    "xtick.minor.width": 0,
-    "xtick.minor.visible": False,
-    "xtick.top": False,
-    "ytick.direction": "out",
-    "ytick.major.size": 3,
-    "ytick.major.width": 0.5,
-    "ytick.minor.size": 1.5,
-    "ytick.minor.width": 0.5,
+PUB_VIOLIN: MappingProxyType = MappingProxyType({
+    **_PUB_BASE,
+    **_PUB_NO_XTICKS,
+    **_PUB_YTICKS,
     "ytick.minor.visible": False,
-    "ytick.right": False,
-    "legend.frameon": False,
     "axes.spines.bottom": False,
-    "axes.spines.top": False,
-    "axes.spines.right": False,
-}
+})
 
 
-PUB_CLUSTER: dict = {
-    "axes.labelsize": 7,
-    "xtick.labelsize": 6,
-    "ytick.labelsize": 6,
-    "legend.fontsize": 7,
-    "font.size": 7,
-    "font.family": "sans-serif",
-    "font.sans-serif": [
-        "Arial",
-    ],
-    "mathtext.fontset": "dejavusans",
-    "axes.linewidth": 0.5,
-    "grid.linewidth": 0.5,
-    "lines.linewidth": 1.0,
-    "lines.markersize": 3,
-    # "savefig.bbox": "tight",
-    # "savefig.pad_inches": 0.01,
-    "xtick.direction": "out",
-    "xtick.major.size": 0,
-    "xtick.major.width": 0,
-    "xtick.minor.size": 0,
-    "xtick.minor.width": 0,
-    "xtick.minor.visible": False,
-    "xtick.top": False,
-    "ytick.direction": "out",
-    "ytick.major.size": 3,
-    "ytick.major.width": 0.5,
-    "ytick.minor.size": 1.5,
-    "ytick.minor.width": 0.5,
+PUB_CLUSTER: MappingProxyType = MappingProxyType({
+    **_PUB_BASE,
+    **_PUB_NO_XTICKS,
+    **_PUB_YTICKS,
     "ytick.minor.visible": False,
-    "ytick.right": False,
-    "legend.frameon": False,
     "axes.spines.bottom": False,
-    "axes.spines.top": False,
-    "axes.spines.right": False,
     "axes.spines.left": False,
-}
+})
 
 
-PUB_BOX_PLOT: dict = {
-    "axes.labelsize": 7,
-    "xtick.labelsize": 6,
-    "ytick.labelsize": 6,
-    "legend.fontsize": 7,
-    "font.size": 7,
-    "font.family": "sans-serif",
-    "font.sans-serif": ["Arial"],
-    "mathtext.fontset": "dejavusans",
-    "axes.linewidth": 0.5,
-    "grid.linewidth": 0.5,
-    "lines.linewidth": 1.0,
-    "lines.markersize": 3,
-    # "savefig.bbox": "tight",
-    # "savefig.pad_inches": 0.01,
-    "xtick.direction": "out",
-    "xtick.major.size": 0,
-    "xtick.major.width": 0,
-    "xtick.minor.size": 0,
-    "xtick.minor.width": 0,
-    "xtick.minor.visible": False,
-    "xtick.top": False,
-    "ytick.direction": "out",
-    "ytick.major.size": 3,
-    "ytick.major.width": 0.5,
-    "ytick.minor.size": 1.5,
-    "ytick.minor.width": 0.5,
-    "ytick.minor.visible": True,
-    "ytick.right": False,
-    "legend.frameon": False,
+PUB_BOX_PLOT: MappingProxyType = MappingProxyType({
+    **_PUB_BASE,
+    **_PUB_NO_XTICKS,
+    **_PUB_YTICKS,
     "axes.spines.bottom": False,
-    "axes.spines.top": False,
-    "axes.spines.right": False,
-}
+})
 
 
-PUB_MAP: dict = {
-    "axes.labelsize": 7,
-    "xtick.labelsize": 6,
-    "ytick.labelsize": 6,
-    "legend.fontsize": 7,
-    "font.size": 7,
-    "font.family": "sans-serif",
-    "font.sans-serif": ["Arial"],
-    "mathtext.fontset": "dejavusans",
+PUB_MAP: MappingProxyType = MappingProxyType({
+    **_PUB_BASE,
+    **_PUB_XTICKS,
+    **_PUB_YTICKS,
     "axes.linewidth": 1.0,
-    "grid.linewidth": 0.5,
-    "lines.linewidth": 1.0,
-    "lines.markersize": 3,
-    # "savefig.bbox": "tight",
-    # "savefig.pad_inches": 0.01,
-    "xtick.direction": "out",
-    "xtick.major.size": 3,
-    "xtick.major.width": 0.5,
-    "xtick.minor.size": 1.5,
-    "xtick.minor.width": 0.5,
-    "xtick.minor.visible": True,
-    "xtick.top": False,
-    "ytick.direction": "out",
-    "ytick.major.size": 3,
-    "ytick.major.width": 0.5,
-    "ytick.minor.size": 1.5,
-    "ytick.minor.width": 0.5,
-    "ytick.minor.visible": True,
-    "ytick.right": False,
-    "legend.frameon": False,
     "axes.spines.bottom": True,
     "axes.spines.top": True,
     "axes.spines.right": True,
-}
+})
 
-PC_GRID: dict = {
+PC_GRID: MappingProxyType = MappingProxyType({
     "figure.facecolor": "white",
     "axes.grid": True,
     "grid.linestyle": "-",
@@ -802,31 +776,18 @@ PC_GRID: dict = {
     "xtick.direction": "out",
     "ytick.direction": "out",
     "font.family": "sans-serif",
-    "font.sans-serif": [
-        "Arial",
-    ],
+    "font.sans-serif": _ARIAL_ONLY,
     "mathtext.fontset": "dejavusans",
-}
+})
 
-BIGGER_PUB_STYLE: dict = {
+BIGGER_PUB_STYLE: MappingProxyType = MappingProxyType({
     "axes.labelsize": 11,
     "xtick.labelsize": 10,
     "ytick.labelsize": 10,
     "legend.fontsize": 10,
     "font.size": 12,
     "font.family": "sans-serif",
-    "font.sans-serif": [
-        "Arial",
-        "DejaVu Sans",
-        # "Arial",
-        "Helvetica",
-        "Lucida Grande",
-        "Verdana",
-        "Geneva",
-        "Lucid",
-        "Avant Garde",
-        "sans-serif",
-    ],
+    "font.sans-serif": _FALLBACK_SANS,
     "mathtext.fontset": "dejavusans",
     "axes.linewidth": 1.0,
     "grid.linewidth": 1,
@@ -851,24 +812,27 @@ BIGGER_PUB_STYLE: dict = {
     "axes.spines.top": False,
     "axes.spines.right": False,
     "legend.frameon": False,
-}
+})
 
 
-BIGGER_PUB_IMAGE_BOUNDS: dict = {
+BIGGER_PUB_IMAGE_BOUNDS: MappingProxyType = MappingProxyType({
     **BIGGER_PUB_STYLE,
     "axes.spines.top": True,
     "axes.spines.right": True,
-}
+})
 
 class Styles:
     """
     Context manager for applying matplotlib styles.
 
+    Only the rcParams set by the style are restored on exit; other rcParams changed
+    inside the context are kept.
+
     :param style: The style name to apply.
     :type style: str
     """
 
-    __styles__: dict[str, dict | RcParams] = {  # noqa: RUF012
+    __styles__: dict[str, Mapping | RcParams] = {  # noqa: RUF012
         "py-grid": PY_GRID,
         "fov-grid-light": {**FOV_GRID, "grid.color": "white"},
         "fov-grid-dark": {**FOV_GRID, "grid.color": "black"},
@@ -891,14 +855,30 @@ class Styles:
     }
 
     def __init__(self, *style: str):
-        _style = self.__styles__[style[0]]
+        self.theme: Mapping | RcParams | None = self._resolve_theme(style)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _resolve_theme(cls, style: tuple[str, ...]) -> Mapping | RcParams:
+        """
+        Merge the requested styles into a single theme, cached by the style tuple.
+
+        The returned theme is shared between contexts and must not be mutated.
+
+        :param style: The style names to merge.
+        :type style: tuple[str, ...]
+        :returns: The merged theme.
+        :rtype: Mapping | RcParams
+        """
+        _style = cls.__styles__[style[0]]
 
         # priority to the first style
         if len(style) > 1:
             for style_ in style:
-                _style = {**self.__styles__[style_], **_style}
+                _style = {**cls.__styles__[style_], **_style}
+            _style = RcParams(_style)
 
-        self.theme: dict | RcParams | None = _style
+        return _style
 
     def __enter__(self):
         """
@@ -907,11 +887,19 @@ class Styles:
         :returns: The Styles context manager.
         :rtype: Styles
         """
-        self._rc_context = mpl.rc_context(self.theme)
-        # noinspection PyUnresolvedReferences
-        self._rc_context.__enter__()
-        # Ensures exported text is editable in Illustrator
-        set_export_text_type()
+        # save only the keys the theme sets rather than snapshotting every rcParam
+        self._saved = {key: mpl.rcParams[key] for key in self.theme}
+        if isinstance(self.theme, RcParams):
+            # already validated, so skip the validators that rcParams.update re-runs;
+            # mutable values are copied so in-place edits cannot reach the cached theme
+            for key, value in self.theme.items():
+                if isinstance(value, list):
+                    value = value.copy()
+                elif isinstance(value, Cycler):
+                    value = cycler(value)
+                mpl.rcParams._set(key, value)  # noqa: SLF001
+        else:
+            mpl.rcParams.update(self.theme)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):  # noqa: ANN001
@@ -922,11 +910,19 @@ class Styles:
         :param exc_val: Exception value.
         :param exc_tb: Exception traceback.
         """
-        # noinspection PyUnresolvedReferences
-        self._rc_context.__exit__(exc_type, exc_val, exc_tb)
+        for key, value in self._saved.items():
+            mpl.rcParams._set(key, value)  # noqa: SLF001
         self.theme = None
 
 
+# validate each preset once at import rather than as a plain dict on every use, and
+# include the export text settings so exported text is editable in Illustrator and
+# restored with the rest of the style on exit
+for _name, _style in list(Styles.__styles__.items()):
+    Styles.__styles__[_name] = RcParams({**_style, **_EXPORT_TEXT_TYPE})
+del _name, _style
+
+
 def fixed_size_subplots(
     nrows: int,
     ncols: int,
@@ -962,20 +958,19 @@ def fixed_size_subplots(
     width = ncols * (m + b + m)
     height = nrows * (h + a + h)
 
+    # (nrows, ncols, 4) array of [left, bottom, width, height] axes rects
+    left = (m + np.arange(ncols) * (2 * m + b)) / width
+    bottom = (height - (np.arange(nrows)[:, None] + 1) * (2 * h + a) + h) / height
+    rects = np.stack(
+        np.broadcast_arrays(left[None, :], bottom, b / width, a / height), axis=-1
+    )
+
     axarr = np.empty((nrows, ncols), dtype=object)
 
     fig = plt.figure(figsize=(width, height))
 
-    for i in range(nrows):
-        for j in range(ncols):
-            axarr[i, j] = fig.add_axes(
-                [
-                    (m + j * (2 * m + b)) / width,
-                    (height - (i + 1) * (2 * h + a) + h) / height,
-                    b / width,
-                    a / height,
-                ]
-            )
+    for idx in np.ndindex(nrows, ncols):
+        axarr[idx] = fig.add_axes(rects[idx].tolist())
     return fig, axarr
 
 
@@ -990,3 +985,33 @@ def create_custom_colormap(
     :return: A LinearSegmentedColormap object.
     """
     return LinearSegmentedColormap.from_list(name, colors)
+
+
+def create_custom_colormap_from_array(
+    colors: np.ndarray, name: str = "custom_colormap"
+) -> LinearSegmentedColormap:
+    """
+    Create a custom colormap from an array of evenly spaced colors.
+
+    Unlike :func:`create_custom_colormap`, the segment data is built directly from
+    the array, so no color has to be parsed by matplotlib.
+
+    :param colors: An (N, 3) or (N, 4) array of RGB(A) colors (0-1).
+    :type colors: np.ndarray
+    :param name: The name of the colormap.
+    :type name: str
+    :returns: A LinearSegmentedColormap object.
+    :rtype: LinearSegmentedColormap
+    :raises ValueError: If the array is not (N, 3) or (N, 4).
+    """
+    colors = np.asarray(colors, dtype=float)
+    if colors.ndim != 2 or colors.shape[1] not in {3, 4}:
+        msg = f"Expected an (N, 3) or (N, 4) array of colors, got shape {colors.shape}"
+        raise ValueError(msg)
+    x = np.linspace(0, 1, colors.shape[0])
+    channels = ("red", "green", "blue", "alpha")[: colors.shape[1]]
+    segmentdata = {
+        channel: np.column_stack((x, colors[:, i], colors[:, i]))
+        for i, channel in enumerate(channels)
+    }
+    return LinearSegmentedColormap(name, segmentdata)
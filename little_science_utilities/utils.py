@@ -1,29 +1,58 @@
+from __future__ import annotations
+
 import logging
-from enum import Enum, IntEnum
-from os import PathLike, getenv
+import re
+import sys
+from contextlib import suppress
+from datetime import datetime
+from enum import Enum, EnumMeta, IntEnum
+from fnmatch import translate
+from logging.handlers import MemoryHandler
+from os import DirEntry, PathLike, scandir, sep
 from pathlib import Path
-from typing import Any
+from threading import Timer
+from time import time
+from typing import TYPE_CHECKING, Any
+
+# matplotlib, pandas, polars, tabulate, and the themes module are imported lazily so
+# that importing this module stays cheap for scripts that only need the enums or logger
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
 
-import polars as pl
-try:
     import pandas as pd
-except ImportError:
-    pd = pl
+    import polars as pl
+    from matplotlib import pyplot as plt
 
-from matplotlib import pyplot as plt
-from tabulate import tabulate
-from datetime import datetime
-from little_science_utilities.themes import export_for_pub, set_export_text_type, export_for_review
 
+class _ListEnumMeta(EnumMeta):
+    """
+    Metaclass that caches the member values of each ListEnum once its members exist.
+    """
 
-class ListEnum(Enum):
+    def __new__(metacls, *args, **kwargs):
+        # the functional API (ListEnum("Name", [...])) only calls __new__, so the
+        # caches are built here rather than in __init__
+        cls = super().__new__(metacls, *args, **kwargs)
+        members = cls.__members__.values()
+        cls._values_tuple = tuple(member.value for member in members)
+        cls._value2member = {}
+        cls._value2index = {}
+        for index, member in enumerate(members):
+            # unhashable values are only found by scanning _values_tuple
+            with suppress(TypeError):
+                cls._value2member.setdefault(member.value, member)
+                cls._value2index.setdefault(member.value, index)
+        return cls
+
+
+class ListEnum(Enum, metaclass=_ListEnumMeta):
     """
     Enum that allows for list-like behavior.
     """
 
     @classmethod
     def __getitem__(cls, item: int) -> Any:
-        return [member.value for member in cls.__members__.values()][item]
+        return cls._values_tuple[item]
 
     @classmethod
     def get(cls, item: int) -> Any:
@@ -31,7 +60,10 @@ class ListEnum(Enum):
 
     @classmethod
     def __contains__(cls, item: Any) -> bool:
-        return item in [member.value for member in cls.__members__.values()]
+        try:
+            return item in cls._value2member
+        except TypeError:
+            return item in cls._values_tuple
 
     @classmethod
     def contains(cls, item: Any) -> bool:
@@ -39,7 +71,13 @@ class ListEnum(Enum):
 
     @classmethod
     def __index__(cls, item: Any) -> int:
-        return [member.value for member in cls.__members__.values()].index(item)
+        try:
+            return cls._value2index[item]
+        except KeyError:
+            msg = f"{item!r} is not a value of {cls.__name__}"
+            raise ValueError(msg) from None
+        except TypeError:
+            return cls._values_tuple.index(item)
 
     @classmethod
     def index(cls, item: Any) -> int:
@@ -50,10 +88,13 @@ class ListEnum(Enum):
         """
         Get the enum member by its value.
         """
-        for member in cls.__members__.values():
-            if member.value == value:
-                return member
-        return default
+        try:
+            return cls._value2member.get(value, default)
+        except TypeError:
+            for member in cls.__members__.values():
+                if member.value == value:
+                    return member
+            return default
 
     @classmethod
     def by_name(cls, name: str, default: Any | None = None) -> Any:
@@ -63,28 +104,90 @@ class ListEnum(Enum):
         return cls.__members__.get(name.upper(), default)
 
     def __eq__(self, other: object):
+        if other is self:
+            return True
         if isinstance(other, str):
-            return self.value == other
+            return self._value_ == other
         if isinstance(other, Enum):
-            return self.value == other.value
+            return self._value_ == other._value_
         return NotImplemented
 
+    def __hash__(self):
+        # consistent with __eq__, so members and their values are interchangeable keys
+        return hash(self._value_)
+
     def __repr__(self):
         return f"{self.__class__.__name__}({self.value})"
 
 
 _BASE_DIRECTORY = Path.cwd()
 
+# pathlib accepts "/" on every platform, in addition to the native separator
+_SEPARATORS = frozenset(("/", sep))
+
+
+def _is_dataframe(obj: Any, module: str, frame: str = "DataFrame") -> bool:
+    """
+    Check whether an object is a frame of the given module without importing it.
+
+    If the module has never been imported, the object cannot be one of its frames.
+    """
+    lib = sys.modules.get(module)
+    return lib is not None and isinstance(obj, getattr(lib, frame))
+
+
+def _is_table(obj: Any) -> bool:
+    """
+    Check whether an object is a polars or pandas frame that can be tabulated.
+    """
+    return (
+        _is_dataframe(obj, "polars")
+        or _is_dataframe(obj, "polars", "LazyFrame")
+        or _is_dataframe(obj, "pandas")
+    )
+
+
+def _scandir_recursive(path: str | PathLike) -> Iterator[DirEntry]:
+    """
+    Recursively yield the entries below a directory, without following symlinks.
+
+    Directories that cannot be read are skipped, as with ``Path.rglob``.
+    """
+    try:
+        with scandir(path) as entries:
+            for entry in entries:
+                yield entry
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+    except OSError:
+        return
+
 
 def statistics_table_to_file(
-    results: pl.DataFrame,
+    results: pl.DataFrame | pl.LazyFrame | pd.DataFrame | Iterable[Sequence[Any]],
     floatfmt: str = ".3f",
     tablefmt: str = "heavy_grid",
     maxcolwidths: int = 10,
+    headers: str | Sequence[str] = "keys",
 ) -> str:
+    """
+    Format a table of results for logging.
+
+    Lazy polars frames are collected only here, so long query chains keep the
+    benefit of polars' query optimization up to the point of display.
+    """
+    from tabulate import tabulate
+
+    if _is_dataframe(results, "polars", "LazyFrame"):
+        results = results.collect()
+    # tabulate cannot read polars frames, so hand it the rows rather than a pandas copy
+    if _is_dataframe(results, "polars"):
+        if headers == "keys":
+            headers = results.columns
+        results = results.rows()
     return tabulate(
         results,
-        headers="keys",
+        headers=headers,
         showindex=False,
         floatfmt=floatfmt,
         tablefmt=tablefmt,
@@ -111,21 +214,75 @@ class ScienceConsoleFormatter(logging.Formatter):
     BLUE: str = "\033[38;2;15;159;255m"
     RESET: str = "\033[0m"
 
-    def format(self, record: logging.LogRecord) -> str:
+    def __init__(self):
         """
-        Format a log record with a custom color scheme.
-
-        :param record: The log record to format.
-        :return: The formatted log message as a string.
+        Build the colored format once rather than a new formatter per record.
         """
-        log_fmt = f"{self.BLUE}%(asctime)s:\n%(message)s{self.RESET}"
-        formatter = logging.Formatter(log_fmt, "%d-%m-%Y %H:%M")
-        return formatter.format(record)
+        super().__init__(
+            f"{self.BLUE}%(asctime)s:\n%(message)s{self.RESET}", "%d-%m-%Y %H:%M"
+        )
+
+
+class _TimedMemoryHandler(MemoryHandler):
+    """
+    A memory handler that also flushes a partly filled buffer after an interval.
+
+    The first record buffered after a flush starts a timer, so every record reaches
+    the target within ``interval`` seconds even if no further records arrive.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        interval: float,
+        flushLevel: int,  # noqa: N803
+        target: logging.Handler,
+    ):
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self.interval = interval
+        self._timer: Timer | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # called with the handler lock held, so the timer is started at most once
+        super().emit(record)
+        if self.buffer and self._timer is None:
+            self._timer = Timer(self.interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            super().flush()
 
 
 class ScienceLogger:
+    __slots__ = (
+        "_FIGURES",
+        "_INTEGRITY",
+        "_STATISTICS",
+        "_buffer_handler",
+        "_console_handler",
+        "_file_handler",
+        "_log_integrity",
+        "_log_statistics",
+        "_save_figures",
+        "_ts_bucket",
+        "_ts_str",
+        "directory",
+        "logger",
+        "name",
+    )
+
     _LINE_LENGTH = 80
     _LOG_LEVEL = logging.INFO
+    _BUFFER_CAPACITY = 512
+    _FLUSH_INTERVAL = 5.0
+    _HEADER = "|" + "=" * (_LINE_LENGTH - 2) + "|"
+    _SUBHEADER = "|" + "-" * (_LINE_LENGTH - 2) + "|"
+    _DEMARCATOR = "" * _LINE_LENGTH
 
     def __init__(
         self,
@@ -135,20 +292,25 @@ class ScienceLogger:
         statistics: Options = Options.SHOW,
         integrity: Options = Options.SHOW,
     ):
-        self._HEADER = "|" + "=" * (self._LINE_LENGTH - 2) + "|"
-        self._SUBHEADER = "|" + "-" * (self._LINE_LENGTH - 2) + "|"
-        self._DEMARCATOR = "" * self._LINE_LENGTH
-
         self._FIGURES = Options(figures)
         self._STATISTICS = Options(statistics)
         self._INTEGRITY = Options(integrity)
+        # resolved once so the logging methods only check a bool
+        self._save_figures = self._FIGURES % 2 == 0
+        self._log_statistics = self._STATISTICS >= Options.SHOW
+        self._log_integrity = self._INTEGRITY >= Options.SHOW
 
         self.name = name
+        self._ts_bucket = -1.0
+        self._ts_str = ""
 
         self.directory = directory if directory else _BASE_DIRECTORY
         self.directory = self.directory.joinpath(self.name)
         self.logger = logging.getLogger(name)
         self.logger.setLevel(self._LOG_LEVEL)
+        self._console_handler = None
+        self._file_handler = None
+        self._buffer_handler = None
 
         if any(
             option >= Options.SHOW
@@ -161,24 +323,29 @@ class ScienceLogger:
 
         if any((option % 2 == 0) for option in (self._STATISTICS, self._INTEGRITY)):
             
-            if not self.directory.exists():
-                self.directory.mkdir(parents=True, exist_ok=True)
-            assert self.directory.is_dir(), f"{self.directory} is not a directory."
-            if not self.figures_directory.exists():
-                self.figures_directory.mkdir(parents=True, exist_ok=True)
-            if not self.data_directory.exists():
-                self.data_directory.mkdir(parents=True, exist_ok=True)
-                
-            if not self.log_file.exists():
-                with self.log_file.open("w") as f:
-                    f.write("")
+            # raises FileExistsError if the path exists but is not a directory
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # the parent now exists, so each subdirectory needs a single mkdir
+            for subdirectory in (self.figures_directory, self.data_directory):
+                subdirectory.mkdir(exist_ok=True)
 
+            # opening in append mode creates the log file if needed
             self._file_handler = logging.FileHandler(
                 self.log_file, mode="a", encoding="utf-8"
             )
             self._file_handler.setLevel(self._LOG_LEVEL)
             self._file_handler.setFormatter(logging.Formatter("%(message)s"))
-            self.logger.addHandler(self._file_handler)
+            # buffer records so the file is written in batches rather than per record;
+            # the buffer is flushed when full, on warnings, after _FLUSH_INTERVAL
+            # seconds, and by logging.shutdown on exit
+            self._buffer_handler = _TimedMemoryHandler(
+                capacity=self._BUFFER_CAPACITY,
+                interval=self._FLUSH_INTERVAL,
+                flushLevel=logging.WARNING,
+                target=self._file_handler,
+            )
+            self._buffer_handler.setLevel(self._LOG_LEVEL)
+            self.logger.addHandler(self._buffer_handler)
 
         self._head(f"{self.name}")
 
@@ -196,32 +363,100 @@ class ScienceLogger:
 
     @property
     def timestamp(self) -> str:
-        return datetime.now().strftime("%d-%m-%Y %H:%M")
+        # the timestamp has minute resolution, so format it at most once per minute
+        now = time()
+        bucket = now // 60
+        if bucket != self._ts_bucket:
+            self._ts_bucket = bucket
+            self._ts_str = datetime.fromtimestamp(now).strftime("%d-%m-%Y %H:%M")
+        return self._ts_str
 
     @property
     def plot(self) -> bool:
-        return self._FIGURES % 2 == 0
+        return self._save_figures
+
+    def flush(self) -> None:
+        """
+        Write any buffered records to the log file.
+        """
+        if self._buffer_handler is not None:
+            self._buffer_handler.flush()
+
+    def close(self) -> None:
+        """
+        Flush the log file and detach this logger's handlers.
+        """
+        handlers = (self._buffer_handler, self._file_handler, self._console_handler)
+        for handler in handlers:
+            if handler is not None:
+                self.logger.removeHandler(handler)
+                handler.close()
+        self._console_handler = None
+        self._file_handler = None
+        self._buffer_handler = None
 
     def find_data(self, data_name: str) -> Path | None:
         """
         Find a data file in the directory.
+
+        A plain relative name that exists inside the data directory is returned
+        without searching the tree.
         """
-        matches = set(self.data_directory.rglob(f"*{data_name}*"))
-        if len(matches) > 1:
-            msg = (
-                f"Multiple files found for {data_name} in "
-                f"{self.data_directory}. Using the first match."
+        # absolute names, "", "." and ".." would resolve to the data directory itself
+        # or outside of it, so they (and any glob) always go through the search
+        if not (
+            data_name in {"", ".", ".."}
+            or Path(data_name).anchor
+            or any(char in data_name for char in "*?[")
+        ):
+            candidate = self.data_directory.joinpath(data_name)
+            if candidate.exists() and (
+                self.data_directory.resolve() in candidate.resolve().parents
+            ):
+                return candidate
+        if any(separator in data_name for separator in _SEPARATORS):
+            # a pattern spanning directories is matched component by component,
+            # which only rglob does; the name-only walk below would never match it
+            matches = map(str, self.data_directory.rglob(f"*{data_name}*"))
+        else:
+            # compile the glob once instead of going through fnmatch for every entry;
+            # like fnmatch, matching is case-insensitive on Windows only
+            is_match = re.compile(
+                translate(f"*{data_name}*"),
+                re.IGNORECASE if sys.platform == "win32" else 0,
+            ).match
+            matches = (
+                entry.path
+                for entry in _scandir_recursive(self.data_directory)
+                if is_match(entry.name)
             )
-            self.logger.warning(msg)
-            return None
-        if len(matches) == 0:
+        match = None
+        for path in matches:
+            if path == match:
+                continue
+            # stop walking as soon as a second match shows up
+            if match is not None:
+                msg = (
+                    f"Multiple files found for {data_name} in "
+                    f"{self.data_directory}. Using the first match."
+                )
+                self.logger.warning(msg)
+                return None
+            match = path
+        if match is None:
             msg = f"No files found for {data_name} in {self.data_directory}."
             self.logger.error(msg)
             raise FileNotFoundError(msg)
-        return matches.pop()
+        return Path(match)
 
     def figure(self, fig: plt.Figure, name: str) -> None:
-        if self._FIGURES % 2 == 0:
+        if self._save_figures:
+            from little_science_utilities.themes import (
+                export_for_pub,
+                export_for_review,
+                set_export_text_type,
+            )
+
             set_export_text_type()
             path = self.figures_directory.joinpath(f"{name}.pdf")
             export_for_pub(fig, path)
@@ -231,15 +466,15 @@ class ScienceLogger:
             msg += f"\nFigure saved to {path}"
             self.logger.info(msg)
 
-    def stats(self, message: str | pl.DataFrame | pd.DataFrame) -> None:
+    def stats(
+        self, message: str | pl.DataFrame | pl.LazyFrame | pd.DataFrame
+    ) -> None:
         """
         Log a message to the stats stream
         """
-        if self._STATISTICS < Options.SHOW:
+        if not self._log_statistics:
             return
-        if isinstance(message, pl.DataFrame):
-            message = message.to_pandas()
-        if isinstance(message, pd.DataFrame):
+        if _is_table(message):
             message = statistics_table_to_file(message)
         msg = f"{self._DEMARCATOR}\n{message}\n{self._DEMARCATOR}"
         self.logger.info(msg)
@@ -248,7 +483,7 @@ class ScienceLogger:
         """
         Log a message to the integrity stream
         """
-        if self._INTEGRITY < Options.SHOW:
+        if not self._log_integrity:
             return
         msg = f"{self._DEMARCATOR}\n{message}\n{self._DEMARCATOR}"
         self.logger.info(msg)
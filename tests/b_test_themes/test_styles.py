@@ -0,0 +1,18 @@
+import matplotlib as mpl
+
+from little_science_utilities.themes import Styles
+
+
+def test_in_place_edit_does_not_leak_into_preset() -> None:
+    with Styles("pub2"):
+        mpl.rcParams["font.sans-serif"].insert(0, "SimHei")
+    assert list(Styles.__styles__["pub2"]["font.sans-serif"]) == ["Arial"]
+    with Styles("pub2"):
+        assert mpl.rcParams["font.sans-serif"] == ["Arial"]
+
+
+def test_exit_restores_rcparams() -> None:
+    before = mpl.rcParams["font.sans-serif"].copy()
+    with Styles("pub2"):
+        assert mpl.rcParams["font.sans-serif"] == ["Arial"]
+    assert mpl.rcParams["font.sans-serif"] == before
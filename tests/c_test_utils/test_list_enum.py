@@ -0,0 +1,35 @@
+import pytest
+
+from little_science_utilities.utils import ListEnum
+
+
+class Letters(ListEnum):
+    A = "a"
+    B = "b"
+
+
+@pytest.fixture(params=["class", "functional"])
+def letters(request: pytest.FixtureRequest) -> type[ListEnum]:
+    if request.param == "class":
+        return Letters
+    return ListEnum("Letters", {"A": "a", "B": "b"})
+
+
+def test_lookups(letters: type[ListEnum]) -> None:
+    assert letters.contains("a")
+    assert not letters.contains("c")
+    assert letters.by_value("b") is letters.B
+    assert letters.by_value("c") is None
+    assert letters.get(0) == "a"
+    assert letters.get(-1) == "b"
+    assert letters.index("b") == 1
+    with pytest.raises(ValueError, match="not a value"):
+        letters.index("c")
+
+
+def test_functional_api_with_names() -> None:
+    numbered = ListEnum("Numbered", ["A", "B"])
+    assert numbered.contains(1)
+    assert numbered.by_value(2) is numbered.B
+    assert numbered.get(0) == 1
+    assert numbered.index(2) == 1